@@ -16,20 +16,28 @@ import sys
 import argparse
 import json
 import csv
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 import re
 import threading
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import multiprocessing
+from itertools import islice
+from operator import attrgetter
+import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import contextlib
+import functools
 import time
 from datetime import datetime
 import shutil
+import stat
+import subprocess
 import requests
-from urllib.parse import urlparse, urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, urljoin, parse_qsl, urlencode
 from bs4 import BeautifulSoup
+import types
 import hashlib  # Ajouté pour le hachage des noms de fichiers longs
 
 # Nouvelle fonction utilitaire ajoutée
@@ -54,7 +62,10 @@ def thread_safe_print(*args, **kwargs):
         print(*args, **kwargs)
 
 class ProgressTracker:
-    """Gestionnaire de progression thread-safe"""
+    """Gestionnaire de progression thread-safe : les workers ne font que déposer un événement,
+    un thread d'affichage dédié tient les compteurs et réécrit la ligne (10 fois par seconde au plus)"""
+    
+    _REFRESH_INTERVAL = 0.1
     
     def __init__(self, total_files: int):
         self.total_files = total_files
@@ -63,32 +74,60 @@ class ProgressTracker:
         self.failed = 0
         self.current_file = ""
         self.start_time = time.time()
-        self.lock = threading.Lock()
-        self._last_update = 0
+        # File d'événements (nom, succès) ; None demande l'arrêt du thread d'affichage
+        self._events = queue.SimpleQueue()
+        self._reporter = threading.Thread(target=self._report_loop, name="progress", daemon=True)
+        self._reporter.start()
         
     def update(self, filename: str, success: bool, message: str = ""):
-        with self.lock:
-            self.completed += 1
-            if success:
-                self.succeeded += 1
-            else:
-                self.failed += 1
-            self.current_file = filename
-            
-            # Afficher la progression toutes les secondes ou à chaque fichier si peu de fichiers
-            current_time = time.time()
-            if (current_time - self._last_update > 1.0) or (self.total_files <= 10) or self.completed == self.total_files:
-                self._display_progress()
-                self._last_update = current_time
+        # Aucun verrou ni écriture terminal dans les workers
+        self._events.put((filename, success))
+    
+    def _report_loop(self):
+        last_display = 0.0
+        stopping = False
+        while not stopping:
+            try:
+                events = [self._events.get(timeout=self._REFRESH_INTERVAL)]
+            except queue.Empty:
+                continue
+            # Vider la file : un seul affichage pour tous les fichiers terminés entre deux rafraîchissements
+            while True:
+                try:
+                    events.append(self._events.get_nowait())
+                except queue.Empty:
+                    break
+            changed = False
+            for event in events:
+                if event is None:
+                    stopping = True
+                    continue
+                filename, success = event
+                self.completed += 1
+                if success:
+                    self.succeeded += 1
+                else:
+                    self.failed += 1
+                self.current_file = filename
+                changed = True
+                # Peu de fichiers : une ligne par fichier
+                if self.total_files <= 10:
+                    self._display_progress(self.completed, self.succeeded, self.failed, filename)
+            if changed and self.total_files > 10:
+                current_time = time.time()
+                if (current_time - last_display >= self._REFRESH_INTERVAL or stopping
+                        or self.completed == self.total_files):
+                    last_display = current_time
+                    self._display_progress(self.completed, self.succeeded, self.failed, self.current_file)
                 
-    def _display_progress(self):
+    def _display_progress(self, completed: int, succeeded: int, failed: int, current_file: str):
         elapsed = time.time() - self.start_time
-        percentage = (self.completed / self.total_files) * 100
+        percentage = (completed / self.total_files) * 100
         
         # Estimation du temps restant
-        if self.completed > 0:
-            avg_time_per_file = elapsed / self.completed
-            remaining_files = self.total_files - self.completed
+        if completed > 0:
+            avg_time_per_file = elapsed / completed
+            remaining_files = self.total_files - completed
             eta = avg_time_per_file * remaining_files
             eta_str = f" | ETA: {self._format_time(eta)}"
         else:
@@ -100,16 +139,16 @@ class ProgressTracker:
         bar = "█" * filled + "░" * (bar_width - filled)
         
         # Affichage compact sur une ligne
-        status = f"\r[{bar}] {percentage:5.1f}% ({self.completed}/{self.total_files}) | ✅{self.succeeded} ❌{self.failed} | {self._format_time(elapsed)}{eta_str}"
+        status = f"\r[{bar}] {percentage:5.1f}% ({completed}/{self.total_files}) | ✅{succeeded} ❌{failed} | {self._format_time(elapsed)}{eta_str}"
         
         # Afficher le fichier en cours si assez de place
-        if len(self.current_file) < 50:
-            status += f" | {os.path.basename(self.current_file)}"
+        if len(current_file) < 50:
+            status += f" | {os.path.basename(current_file)}"
         
         print(status, end="", flush=True)
         
         # Nouvelle ligne à la fin
-        if self.completed == self.total_files:
+        if completed == self.total_files:
             print()
             
     def _format_time(self, seconds: float) -> str:
@@ -122,7 +161,9 @@ class ProgressTracker:
             return f"{seconds/3600:.1f}h"
             
     def final_summary(self):
-        """Affiche le résumé final"""
+        """Affiche le résumé final (après traitement de tous les événements en attente)"""
+        self._events.put(None)
+        self._reporter.join()
         elapsed = time.time() - self.start_time
         print(f"\n📊 Conversion terminée en {self._format_time(elapsed)}")
         print(f"   ✅ Réussis: {self.succeeded}")
@@ -141,9 +182,22 @@ def install_requirements():
         "odfpy", "ebooklib", "pyyaml", "pdfminer.six", "pdfplumber", "requests"
     ]
     print("Installation des dépendances via pip (peut prendre du temps)...")
-    for i, d in enumerate(deps, 1):
-        print(f"[{i}/{len(deps)}] Installation de {d}...")
-        os.system(f"{sys.executable} -m pip install {d} -q")
+    print(f"📦 {len(deps)} paquets: {', '.join(deps)}")
+    pip_cmd = [sys.executable, "-m", "pip", "install", "--quiet", "--disable-pip-version-check"]
+    # Un seul appel pip : résolution des dépendances et cache HTTP partagés
+    try:
+        subprocess.check_call(pip_cmd + deps)
+    except subprocess.CalledProcessError as e:
+        # pip n'installe rien si un seul paquet échoue : nouvelle tentative paquet par paquet
+        print(f"⚠️ Échec de l'installation groupée (code {e.returncode}), installation paquet par paquet...")
+        failed = []
+        for dep in deps:
+            try:
+                subprocess.check_call(pip_cmd + [dep])
+            except subprocess.CalledProcessError:
+                failed.append(dep)
+        if failed:
+            print(f"❌ Paquets non installés: {', '.join(failed)}")
     print("✅ Installation terminée. Note: Tesseract (binaire) doit être installé séparément.")
 
 def human_readable_size(size_bytes: int) -> str:
@@ -157,6 +211,18 @@ def human_readable_size(size_bytes: int) -> str:
         i += 1
     return f"{s:.1f} {units[i]}"
 
+def _effective_cpu_count() -> int:
+    """Nombre de CPU réellement utilisables par le processus (affinité, conteneurs),
+    et non le nombre de cœurs de la machine"""
+    if hasattr(os, 'process_cpu_count'):  # Python 3.13+
+        count = os.process_cpu_count()
+    else:
+        try:
+            count = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):  # sched_getaffinity absent hors Linux
+            count = os.cpu_count()
+    return count or 1
+
 def safe_import(module_name: str):
     """Import dynamique renvoyant module ou None si absent."""
     try:
@@ -165,30 +231,96 @@ def safe_import(module_name: str):
     except Exception:
         return None
 
+# Parser HTML : lxml (C) si disponible, sinon le parser pur Python de la stdlib
+HTML_PARSER = 'lxml' if safe_import('lxml') is not None else 'html.parser'
+
+# Sérialiseur JSON en C (optionnel) pour reformater les JSON minifiés
+_ORJSON = safe_import('orjson')
+# orjson convertit silencieusement en float les entiers au-delà de 64 bits (20 chiffres et plus) :
+# ces fichiers passent par json pour conserver les nombres exacts
+_JSON_BIG_INT_RE = re.compile(r'\d{20,}')
+
+# En-têtes HTTP appliqués une fois pour toutes à la session du convertisseur
+_DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+# Délai maximal (secondes) d'une requête HTTP
+_REQUEST_TIMEOUT = 15
+
+# Balises supprimées (avec leur contenu) et balises converties dans les pages web
+_SKIPPED_TAGS = frozenset(['script', 'style', 'header', 'footer', 'nav',
+                           'aside', 'form', 'iframe', 'button', 'noscript'])
+_CONTENT_TAGS = frozenset(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                           'ul', 'ol', 'table', 'blockquote', 'pre'])
+
+# Nombre maximal de pages PDF rendues en image par appel à pdf2image
+_PDF_RENDER_BATCH = 16
+
+# Taille maximale téléchargée pour une page web (au-delà, le contenu est tronqué)
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Paramètres de requête conservés lors de la normalisation des URLs explorées
+_USEFUL_QUERY_PARAMS = frozenset(['id', 'p', 'page', 'post', 'article'])
+
+# Table de remplacement des caractères interdits dans les noms de fichiers (Windows)
+_FORBIDDEN_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Longueur de chemin au-delà de laquelle les noms de fichiers sont raccourcis (Windows)
+_IS_WINDOWS = os.name == 'nt'
+_MAX_PATH = 240
+
+# Formats dont la conversion est limitée par le CPU (parsing, rendu, OCR) : envoyés aux
+# processus de l'option --processes, les autres restent sur les threads
+_CPU_BOUND_EXTS = frozenset(['.pdf', '.docx', '.xlsx', '.xls', '.pptx', '.odt', '.ods', '.odp', '.epub',
+                             '.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.gif', '.webp'])
+
+# Type de forme PPTX des images (pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE, python-pptx étant optionnel)
+_PPTX_PICTURE = 13
+
+# Dossiers jamais explorés en mode récursif (outils, dépendances, artefacts de build) ;
+# les dossiers cachés (".xxx") sont également ignorés
+_PRUNED_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'})
+
+# Cache des dossiers de sortie déjà créés (mode dossier), sans extension pour ne jamais être converti
+_DIRCACHE_NAME = '.convertisseur-dircache'
+
+# Séparateurs CSV candidats pour décider si la détection du dialecte est nécessaire
+_CSV_DELIMITERS = ',;\t|'
+
+# Lecture basique des .doc : les octets non imprimables (hors tab/CR/LF, ASCII et Latin-1 U+00A0-U+00FF)
+# sont ramenés à \x00 par une table d'octets, puis chaque suite est remplacée par un espace
+_DOC_KEEP = bytes(c if c in (9, 10, 13) or 32 <= c <= 126 or c >= 0xA0 else 0 for c in range(256))
+_DOC_STRIP_RE = re.compile(rb'\x00+')
+
 # ---------------------------
 # Gestionnaire d'exploration de sites
 # ---------------------------
 
 class SiteCrawler:
-    def __init__(self, base_url, max_depth=2, max_pages=20, delay=1, verbose=False):
+    def __init__(self, base_url, max_depth=2, max_pages=20, delay=1, verbose=False, session=None):
         self.base_url = base_url
         self.domain = urlparse(base_url).netloc
         self.visited = set()
         self.to_visit = deque([(base_url, 0)])
+        # URLs déjà mises en file (jamais retirées) : test d'appartenance en O(1)
+        self.queued = {base_url}
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.delay = delay
         self.page_count = 0
         self.verbose = verbose
+        # Session HTTP partagée avec le convertisseur (connexions keep-alive)
+        self.session = session or requests.Session()
+        # Politesse par hôte : heure du dernier téléchargement réservé (file d'URLs gérée par le thread principal)
+        self.last_fetch = {}
+        self.lock = threading.Lock()
         
-        # Domaines de réseaux sociaux à ignorer
-        self.social_domains = [
+        # Domaines de réseaux sociaux à ignorer (comparés au nom d'hôte et à ses suffixes)
+        self.social_domains = frozenset([
             'facebook.com', 'twitter.com', 'linkedin.com', 
             'instagram.com', 'youtube.com', 'github.com',
             'pinterest.com', 'reddit.com', 'tumblr.com',
             'snapchat.com', 'whatsapp.com', 'tiktok.com',
             'paypal.com', 't.co', 'bit.ly', 'tinyurl.com'
-        ]
+        ])
         
         # Mots-clés dans les URL à ignorer (version ultra-complète)
         self.ignore_keywords = [
@@ -281,67 +413,93 @@ class SiteCrawler:
             r'\.xml$',             # Fichiers XML (souvent des flux)
             r'\.(jpg|jpeg|png|gif|webp|svg|exe|mp3|mp4|avi|mov)$'  # Fichiers média
         ]
+        
+        # Texte et classes CSS des liens à ignorer
+        self.ignore_texts = [
+            'commentaire', 'comment', 'répondre', 'reply', 'réponse',
+            'laisser un commentaire', 'leave a comment', 'post a comment',
+            'share', 'partager', 'follow', 'suivre', 'like', 'aimer',
+            'subscribe', 's\'abonner', 'newsletter', 'rss', 'feed'
+        ]
+        self.ignore_classes = [
+            'comment', 'reply', 'share', 'social', 'follow',
+            'subscribe', 'newsletter', 'feed', 'widget',
+            'sidebar', 'footer', 'header', 'nav'
+        ]
+        
+        # Précompilation : une seule recherche regex par critère au lieu d'une boucle Python
+        self._ignore_keywords_re = self._compile_alternation(self.ignore_keywords)
+        self._ignore_patterns_re = re.compile('|'.join(self.ignore_patterns))
+        self._ignore_texts_re = self._compile_alternation(self.ignore_texts)
+        self._ignore_classes_re = self._compile_alternation(self.ignore_classes)
+        self._ignore_id_re = self._compile_alternation(['comment', 'reply', 'share', 'social'])
+
+    @staticmethod
+    def _compile_alternation(words):
+        """Compile une liste de sous-chaînes littérales en une seule regex"""
+        return re.compile('|'.join(re.escape(w) for w in words))
+
+    def _is_social_host(self, hostname):
+        """Vrai si l'hôte (ou un domaine parent) est un réseau social connu"""
+        labels = (hostname or '').split('.')
+        return any('.'.join(labels[i:]) in self.social_domains for i in range(len(labels)))
 
     def get_next_url(self):
-        if not self.to_visit or self.page_count >= self.max_pages:
-            return None
-            
-        url, depth = self.to_visit.popleft()
-        if url in self.visited:
-            return self.get_next_url()
-            
-        self.visited.add(url)
-        self.page_count += 1
-        return url, depth
+        # Boucle (et non récursion) pour sauter les URLs déjà visitées
+        while self.to_visit and self.page_count < self.max_pages:
+            url, depth = self.to_visit.popleft()
+            if url in self.visited:
+                continue
+                
+            self.visited.add(url)
+            self.page_count += 1
+            return url, depth
+        return None
 
-    def _should_ignore_link(self, url, link_element=None):
-        """Détermine si un lien doit être ignoré"""
-        parsed = urlparse(url)
-        
+    def wait_turn(self, url):
+        """Attend que le délai minimal entre deux requêtes vers le même hôte soit écoulé"""
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.last_fetch.get(host, now - self.delay) + self.delay)
+            self.last_fetch[host] = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _should_ignore_link(self, url, parsed, link_element=None):
+        """Détermine si un lien doit être ignoré (`parsed` : résultat de urlparse(url))"""
         # Ignorer les liens vides ou avec protocoles non HTTP
         if not url or url.startswith('javascript:') or url.startswith('mailto:') or url.startswith('tel:'):
             return True
             
         # Ignorer les réseaux sociaux
-        if any(domain in parsed.netloc for domain in self.social_domains):
+        if self._is_social_host(parsed.hostname):
             return True
             
         # Vérifier les mots-clés dans l'URL complète (path + query + fragment)
-        full_path = (parsed.path + '?' + parsed.query + '#' + parsed.fragment).lower()
-        if any(keyword in full_path for keyword in self.ignore_keywords):
+        full_path = f"{parsed.path}?{parsed.query}#{parsed.fragment}".lower()
+        if self._ignore_keywords_re.search(full_path):
             return True
             
         # Vérifier les patterns regex
-        for pattern in self.ignore_patterns:
-            if re.search(pattern, url.lower()):
-                return True
+        if self._ignore_patterns_re.search(url.lower()):
+            return True
                 
-        # Analyser le texte du lien et ses attributs
+        # Analyser les attributs puis le texte du lien (du moins coûteux au plus coûteux)
         if link_element:
-            # Texte du lien
-            link_text = link_element.get_text().lower().strip()
-            ignore_texts = [
-                'commentaire', 'comment', 'répondre', 'reply', 'réponse',
-                'laisser un commentaire', 'leave a comment', 'post a comment',
-                'share', 'partager', 'follow', 'suivre', 'like', 'aimer',
-                'subscribe', 's\'abonner', 'newsletter', 'rss', 'feed'
-            ]
-            if any(text in link_text for text in ignore_texts):
+            # ID de l'élément
+            element_id = link_element.get('id', '').lower()
+            if element_id and self._ignore_id_re.search(element_id):
                 return True
                 
             # Classes CSS du lien
             css_classes = ' '.join(link_element.get('class', [])).lower()
-            ignore_classes = [
-                'comment', 'reply', 'share', 'social', 'follow',
-                'subscribe', 'newsletter', 'feed', 'widget',
-                'sidebar', 'footer', 'header', 'nav'
-            ]
-            if any(cls in css_classes for cls in ignore_classes):
+            if css_classes and self._ignore_classes_re.search(css_classes):
                 return True
                 
-            # ID de l'élément
-            element_id = link_element.get('id', '').lower()
-            if any(keyword in element_id for keyword in ['comment', 'reply', 'share', 'social']):
+            # Texte du lien (parcourt tous les descendants du <a>, calculé en dernier)
+            link_text = link_element.get_text(separator=' ', strip=True).lower()
+            if self._ignore_texts_re.search(link_text):
                 return True
                 
         return False
@@ -379,25 +537,25 @@ class SiteCrawler:
                     continue
                     
                 # Vérifier si le lien doit être ignoré
-                if self._should_ignore_link(absolute_url, link):
+                if self._should_ignore_link(absolute_url, parsed, link):
                     links_ignored += 1
                     continue
                     
                 # Normaliser l'URL (supprimer les fragments sauf s'ils sont significatifs)
                 clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
                 if parsed.query:
-                    # Garder seulement certains paramètres utiles
-                    useful_params = ['id', 'p', 'page', 'post', 'article']
-                    query_params = dict(param.split('=') for param in parsed.query.split('&') if '=' in param)
-                    filtered_params = {k: v for k, v in query_params.items() if k in useful_params}
-                    if filtered_params:
-                        clean_url += '?' + '&'.join(f"{k}={v}" for k, v in filtered_params.items())
+                    # Garder seulement certains paramètres utiles, triés pour une URL canonique
+                    params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                              if k in _USEFUL_QUERY_PARAMS]
+                    if params:
+                        clean_url += '?' + urlencode(sorted(params))
                 
                 # Éviter les doublons
                 if (clean_url not in self.visited and 
-                    clean_url not in [url for url, _ in self.to_visit] and
+                    clean_url not in self.queued and
                     clean_url != current_url):
                     self.to_visit.append((clean_url, current_depth + 1))
+                    self.queued.add(clean_url)
                     
             except Exception as e:
                 links_ignored += 1
@@ -413,6 +571,50 @@ class SiteCrawler:
 # Convertisseur
 # ---------------------------
 class UniversalFileConverter:
+    # map extension -> nom de la méthode de conversion (table partagée, résolue à l'appel)
+    supported_formats = types.MappingProxyType({
+        '.txt': 'convert_txt',
+        '.md': 'convert_txt',
+        '.rtf': 'convert_rtf',
+        '.doc': 'convert_doc',
+        '.docx': 'convert_docx',
+        '.xls': 'convert_xls',
+        '.xlsx': 'convert_xlsx',
+        '.ppt': 'convert_ppt',
+        '.pptx': 'convert_pptx',
+        '.odt': 'convert_odt',
+        '.ods': 'convert_ods',
+        '.odp': 'convert_odp',
+        '.html': 'convert_html',
+        '.htm': 'convert_html',
+        '.xml': 'convert_xml',
+        '.xhtml': 'convert_html',
+        '.csv': 'convert_csv',
+        '.tsv': 'convert_tsv',
+        '.json': 'convert_json',
+        '.yaml': 'convert_yaml',
+        '.yml': 'convert_yaml',
+        '.pdf': 'convert_pdf',
+        '.epub': 'convert_epub',
+        '.png': 'convert_image',
+        '.jpg': 'convert_image',
+        '.jpeg': 'convert_image',
+        '.bmp': 'convert_image',
+        '.tiff': 'convert_image',
+        '.tif': 'convert_image',
+        '.gif': 'convert_image',
+        '.webp': 'convert_image',
+        '.log': 'convert_log',
+        '.ini': 'convert_config',
+        '.cfg': 'convert_config',
+        '.conf': 'convert_config',
+        '.url': 'convert_webpage',
+        'http': 'convert_webpage',
+        'https': 'convert_webpage',
+    })
+    # Extensions de fichiers supportées, en minuscules et sans le point (filtrage des parcours)
+    _supported_exts = frozenset(ext[1:] for ext in supported_formats if ext.startswith('.'))
+
     def __init__(self,
                  ocr_force: bool = False,
                  no_compress: bool = False,
@@ -421,65 +623,61 @@ class UniversalFileConverter:
                  verbose: bool = False,
                  semantic_mode: bool = False,
                  pptx_images: bool = False,
-                 pptx_notes: bool = False):
+                 pptx_notes: bool = False,
+                 zstd_output: bool = False,
+                 processes: bool = False,
+                 schedule: str = 'lpt',
+                 prefetch: bool = False):
         self.ocr_force = ocr_force
         self.no_compress = no_compress
         self.ocr_language = ocr_language
-        self.threads = threads or max(1, multiprocessing.cpu_count() - 1)
+        self.threads = threads or max(1, _effective_cpu_count() - 1)
         self.verbose = verbose
         self.semantic_mode = semantic_mode
         self.pptx_images = pptx_images
         self.pptx_notes = pptx_notes
-
-        # map extension -> handler
-        self.supported_formats = {
-            '.txt': self.convert_txt,
-            '.md': self.convert_txt,
-            '.rtf': self.convert_rtf,
-            '.doc': self.convert_doc,
-            '.docx': self.convert_docx,
-            '.xls': self.convert_xls,
-            '.xlsx': self.convert_xlsx,
-            '.ppt': self.convert_ppt,
-            '.pptx': self.convert_pptx,
-            '.odt': self.convert_odt,
-            '.ods': self.convert_ods,
-            '.odp': self.convert_odp,
-            '.html': self.convert_html,
-            '.htm': self.convert_html,
-            '.xml': self.convert_xml,
-            '.xhtml': self.convert_html,
-            '.csv': self.convert_csv,
-            '.tsv': self.convert_tsv,
-            '.json': self.convert_json,
-            '.yaml': self.convert_yaml,
-            '.yml': self.convert_yaml,
-            '.pdf': self.convert_pdf,
-            '.epub': self.convert_epub,
-            '.png': self.convert_image,
-            '.jpg': self.convert_image,
-            '.jpeg': self.convert_image,
-            '.bmp': self.convert_image,
-            '.tiff': self.convert_image,
-            '.tif': self.convert_image,
-            '.gif': self.convert_image,
-            '.webp': self.convert_image,
-            '.log': self.convert_log,
-            '.ini': self.convert_config,
-            '.cfg': self.convert_config,
-            '.conf': self.convert_config,
-            '.url': self.convert_webpage,
-            'http': self.convert_webpage,
-            'https': self.convert_webpage,
-        }
+        # Formats gourmands en CPU convertis dans des processus séparés (hors GIL)
+        self.processes = processes
+        # Ordre de soumission des lots : 'lpt' (plus gros d'abord) ou 'fifo'
+        self.schedule = schedule
+        # Préchargement des fichiers à venir dans le cache disque du noyau (posix_fadvise)
+        self.prefetch = prefetch
+        
+        # Compression zstd des pages d'un site exploré (option --zstd, dépendance optionnelle)
+        self.zstd_output = zstd_output and not no_compress
+        self._zstd = safe_import('zstandard') if self.zstd_output else None
+        if self.zstd_output and self._zstd is None:
+            print("⚠️ Dépendance manquante pour --zstd: pip install zstandard (sortie .md non compressée)")
+            self.zstd_output = False
+        # Un compresseur zstd par thread (les instances ne sont pas thread-safe)
+        self._zstd_local = threading.local()
+
+        # Bibliothèques OCR optionnelles, résolues une seule fois pour tous les fichiers
+        self._pdf2image = safe_import('pdf2image')
+        self._pytesseract = safe_import('pytesseract')
+        # Pool OCR partagé par tous les threads de conversion (créé au premier PDF scanné) :
+        # au plus min(threads, CPU) processus tesseract simultanés, quel que soit le nombre de PDF en cours
+        self._ocr_pool = None
+        self._ocr_pool_lock = threading.Lock()
+
+        # Session HTTP réutilisée (keep-alive) : une seule poignée de main TCP/TLS par hôte
+        self.session = requests.Session()
+        self.session.headers.update(_DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self.threads,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_handler(self, ext: str):
+        """Retourne la méthode de conversion associée à une extension (ou None)"""
+        method_name = self.supported_formats.get(ext)
+        return getattr(self, method_name) if method_name else None
 
     @staticmethod
     def sanitize_path_component(component: str, max_length: int = 100) -> str:
         """Nettoie et tronque les composants de chemin pour éviter les erreurs"""
-        # Caractères interdits sous Windows
-        forbidden_chars = r'<>:"/\|?*'
-        for c in forbidden_chars:
-            component = component.replace(c, '_')
+        # Caractères interdits sous Windows, remplacés en une seule passe
+        component = component.translate(_FORBIDDEN_TRANS)
         # Tronquer si nécessaire
         if len(component) > max_length:
             component = component[:max_length]
@@ -496,121 +694,72 @@ class UniversalFileConverter:
         print(f"📊 Profondeur max: {max_depth} | Pages max: {max_pages}")
         print("-" * 60)
         
-        crawler = SiteCrawler(base_url, max_depth, max_pages, verbose=self.verbose)
+        crawler = SiteCrawler(base_url, max_depth, max_pages, verbose=self.verbose, session=self.session)
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Fichier d'index
-        index_content = [
-            f"# Archive du site: {base_url}",
-            f"**Date de création:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"**Pages converties:** 0",
-            f"**Profondeur max:** {max_depth}",
-            ""
-        ]
+        # Fichier d'index écrit au fil de l'eau : un arrêt en cours d'exploration laisse un index partiel
+        try:
+            index_file = open(output_path / "INDEX.md", 'w', encoding='utf-8', buffering=1 << 16)
+        except Exception as e:
+            print(f"❌ Erreur écriture index: {e}")
+            return
         
         page_count = 0
         start_time = time.time()
-        
-        while True:
-            next_page = crawler.get_next_url()
-            if not next_page:
-                break
-                
-            url, depth = next_page
-            page_count += 1
-            
-            # Créer un chemin de sortie basé sur l'URL
-            parsed = urlparse(url)
-            domain = self.sanitize_path_component(parsed.netloc, 100)
-            path_segments = [
-                self.sanitize_path_component(seg, 50) 
-                for seg in parsed.path.split('/') 
-                if seg
-            ]
-            
-            if not path_segments:
-                file_name = "index"
-                path_segments_dirs = []
-            else:
-                file_name = self.sanitize_path_component(path_segments[-1], 100)
-                path_segments_dirs = path_segments[:-1]
-            
-            # Créer la structure de dossiers
-            page_dir = output_path / domain
-            if path_segments_dirs:
-                page_dir = page_dir / '/'.join(path_segments_dirs)
-            
-            # Créer le chemin complet et vérifier la longueur
-            full_path = page_dir / f"{file_name}.md"
-            full_path_str = str(full_path)
-            
-            # Tronquer le chemin si trop long (nouvelle solution robuste)
-            if len(full_path_str) > 240:
-                # Solution 1: Raccourcir le nom de fichier
-                new_file_name = self.sanitize_path_component(file_name, 50)
-                full_path = page_dir / f"{new_file_name}.md"
-                full_path_str = str(full_path)
-                
-                # Solution 2: Utiliser un hash si toujours trop long
-                if len(full_path_str) > 240:
-                    file_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:12]
-                    full_path = page_dir / f"{file_hash}.md"
-            
-            try:
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                print(f"❌ Erreur création dossier: {e}")
-                continue
-            
-            # Convertir la page
-            print(f"🔍 [{page_count}] Conversion: {url} (profondeur {depth})")
-            markdown, soup = self.convert_webpage(url, depth)
+        # Fermé dans tous les cas, y compris sur exception pendant l'exploration
+        with index_file:
+            index_file.write(f"# Archive du site: {base_url}\n")
+            index_file.write(f"**Date de création:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            index_file.write("**Pages converties:** ")
+            # Champ de largeur fixe, réécrit en place une fois le nombre de pages connu
+            page_count_offset = index_file.tell()
+            index_file.write(f"{0:<10}\n")
+            index_file.write(f"**Profondeur max:** {max_depth}\n\n")
+            # Lignes d'index produites par les workers
+            index_rows = queue.SimpleQueue()
+            # Pages en cours de traitement : Future -> (url, profondeur)
+            in_flight = {}
+            # Dossiers déjà créés (un seul mkdir par dossier)
+            made_dirs = {output_path}
             
             try:
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
-            except OSError as e:
-                # Gestion spécifique des erreurs de chemin trop long
-                if "too long" in str(e).lower() or "nom trop long" in str(e).lower():
-                    # Solution finale: utiliser un chemin court avec hash
-                    file_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:12]
-                    short_path = output_path / "short" / f"{file_hash}.md"
-                    short_path.parent.mkdir(parents=True, exist_ok=True)
+                with ThreadPoolExecutor(max_workers=self.threads) as ex:
+                    while True:
+                        # Alimenter le pool tant qu'il reste des URLs et de la place
+                        while len(in_flight) < self.threads:
+                            next_page = crawler.get_next_url()
+                            if not next_page:
+                                break
+                            url, depth = next_page
+                            page_count += 1
+                            # même verrou que les workers : pas de lignes entremêlées
+                            thread_safe_print(f"🔍 [{page_count}] Conversion: {url} (profondeur {depth})")
+                            future = ex.submit(self._crawl_page, crawler, url, depth,
+                                               output_path, made_dirs, index_rows)
+                            in_flight[future] = next_page
                     
-                    with open(short_path, 'w', encoding='utf-8') as f:
-                        f.write(markdown)
-                    print(f"  ⚠️ Chemin trop long, fichier sauvegardé sous: {short_path}")
-                else:
-                    print(f"❌ Erreur écriture fichier: {e}")
-                continue
-            except Exception as e:
-                print(f"❌ Erreur écriture fichier: {e}")
-                continue
-            
-            # Ajouter à l'index
-            try:
-                rel_path = os.path.relpath(full_path, output_path)
-                index_content.append(f"- [{parsed.path}]({rel_path}) (profondeur {depth})")
-            except Exception as e:
-                print(f"⚠️ Erreur création lien relatif: {e}")
-                index_content.append(f"- {url} (profondeur {depth})")
-            
-            # Ajouter les liens trouvés pour exploration
-            crawler.add_links(soup, url, depth)
-            
-            # Respecter un délai entre les requêtes
-            time.sleep(1)
-        
-        # Mettre à jour le compteur de pages dans l'index
-        index_content[2] = f"**Pages converties:** {page_count}"
-        
-        # Écrire l'index
-        try:
-            with open(output_path / "INDEX.md", 'w', encoding='utf-8') as f:
-                f.write("\n".join(index_content))
-        except Exception as e:
-            print(f"❌ Erreur écriture index: {e}")
+                        if not in_flight:
+                            break
+                    
+                        # Le thread principal ne fait qu'étendre la file d'URLs
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            url, depth = in_flight.pop(fut)
+                            soup = fut.result()
+                            if soup is not None:
+                                # Ajouter les liens trouvés pour exploration
+                                crawler.add_links(soup, url, depth)
+                        self._flush_index_rows(index_rows, index_file)
+            finally:
+                # Finaliser l'index, même si l'exploration a été interrompue :
+                # dernières lignes puis compteur de pages
+                try:
+                    self._flush_index_rows(index_rows, index_file)
+                    index_file.seek(page_count_offset)
+                    index_file.write(f"{page_count:<10}")
+                except Exception as e:
+                    thread_safe_print(f"❌ Erreur écriture index: {e}")
         
         elapsed = time.time() - start_time
         print("\n" + "=" * 60)
@@ -619,14 +768,118 @@ class UniversalFileConverter:
         print(f"📁 Dossier de sortie: {output_dir}")
         print(f"📄 Fichier d'index: {output_path / 'INDEX.md'}")
 
+    def _write_markdown(self, path: Path, markdown: str):
+        """Écrit une page Markdown, compressée en zstd si l'option est active"""
+        if not self.zstd_output:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            return
+        cctx = getattr(self._zstd_local, 'cctx', None)
+        if cctx is None:
+            cctx = self._zstd_local.cctx = self._zstd.ZstdCompressor(level=3)
+        with open(path, 'wb') as f:
+            f.write(cctx.compress(markdown.encode('utf-8')))
+
+    @staticmethod
+    def _flush_index_rows(index_rows: queue.SimpleQueue, index_file):
+        """Écrit dans l'index les lignes en attente et les pousse sur le disque"""
+        while not index_rows.empty():
+            index_file.write(index_rows.get() + "\n")
+        index_file.flush()
+
+    def _crawl_page(self, crawler: SiteCrawler, url: str, depth: int, output_path: Path,
+                    made_dirs: set, index_rows: queue.SimpleQueue) -> Optional[BeautifulSoup]:
+        """
+        Télécharge, convertit et enregistre une page du site (exécuté dans un thread du pool).
+        Retourne la soup pour l'extraction des liens, ou None si la page n'a pas pu être écrite.
+        """
+        crawler.wait_turn(url)
+        markdown, soup = self.convert_webpage(url, depth)
+        suffix = ".md.zst" if self.zstd_output else ".md"
+        
+        # Créer un chemin de sortie basé sur l'URL
+        parsed = urlparse(url)
+        domain = self.sanitize_path_component(parsed.netloc, 100)
+        path_segments = [
+            self.sanitize_path_component(seg, 50) 
+            for seg in parsed.path.split('/') 
+            if seg
+        ]
+
+        if not path_segments:
+            file_name = "index"
+            path_segments_dirs = []
+        else:
+            file_name = self.sanitize_path_component(path_segments[-1], 100)
+            path_segments_dirs = path_segments[:-1]
+
+        # Créer la structure de dossiers
+        page_dir = output_path / domain
+        if path_segments_dirs:
+            page_dir = page_dir / '/'.join(path_segments_dirs)
+
+        # Créer le chemin complet et vérifier la longueur
+        full_path = page_dir / f"{file_name}{suffix}"
+
+        # Tronquer le chemin si trop long (limite MAX_PATH de Windows ; ailleurs,
+        # le cas rarissime d'un chemin trop long est traité par l'OSError ci-dessous)
+        if _IS_WINDOWS and len(str(full_path)) > _MAX_PATH:
+            # Solution 1: Raccourcir le nom de fichier
+            new_file_name = self.sanitize_path_component(file_name, 50)
+            full_path = page_dir / f"{new_file_name}{suffix}"
+    
+            # Solution 2: Utiliser un hash si toujours trop long
+            if len(str(full_path)) > _MAX_PATH:
+                file_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
+                full_path = page_dir / f"{file_hash}{suffix}"
+
+        if full_path.parent not in made_dirs:
+            try:
+                full_path.parent.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                thread_safe_print(f"❌ Erreur création dossier: {e}")
+                return None
+            made_dirs.add(full_path.parent)
+
+        try:
+            self._write_markdown(full_path, markdown)
+        except OSError as e:
+            # Gestion spécifique des erreurs de chemin trop long
+            if "too long" in str(e).lower() or "nom trop long" in str(e).lower():
+                # Solution finale: utiliser un chemin court avec hash
+                file_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
+                short_path = output_path / "short" / f"{file_hash}{suffix}"
+                short_path.parent.mkdir(parents=True, exist_ok=True)
+        
+                self._write_markdown(short_path, markdown)
+                thread_safe_print(f"  ⚠️ Chemin trop long, fichier sauvegardé sous: {short_path}")
+            else:
+                thread_safe_print(f"❌ Erreur écriture fichier: {e}")
+            return None
+        except Exception as e:
+            thread_safe_print(f"❌ Erreur écriture fichier: {e}")
+            return None
+
+        # Ajouter à l'index
+        try:
+            rel_path = full_path.relative_to(output_path)
+            index_rows.put(f"- [{parsed.path}]({rel_path}) (profondeur {depth})")
+        except Exception as e:
+            thread_safe_print(f"⚠️ Erreur création lien relatif: {e}")
+            index_rows.put(f"- {url} (profondeur {depth})")
+
+        return soup
+
     # -----------------------
     # High-level file processing avec progression
     # -----------------------
     def convert_file_with_progress(self, input_path: str, output_path: Optional[str] = None, 
-                                 progress_tracker: Optional[ProgressTracker] = None) -> Tuple[bool, str]:
+                                 progress_tracker: Optional[ProgressTracker] = None,
+                                 made_dirs: Optional[set] = None) -> Tuple[bool, str, str]:
         """
         Convertit un fichier ou une URL vers markdown avec suivi de progression.
-        Retourne (success, message)
+        `made_dirs` : dossiers de sortie (chaînes) déjà créés par l'appelant (mkdir évité).
+        Retourne (success, message, nom affiché) : l'appelant n'a pas à conserver la source
         """
         # Détecter si c'est une URL
         is_url = input_path.startswith('http://') or input_path.startswith('https://')
@@ -642,15 +895,15 @@ class UniversalFileConverter:
                 msg = f"Fichier introuvable: {input_path}"
                 if progress_tracker:
                     progress_tracker.update(p.name, False, msg)
-                return False, msg
+                return False, msg, p.name
 
             ext = p.suffix.lower()
-            handler = self.supported_formats.get(ext)
+            handler = self.get_handler(ext)
             if not handler:
                 msg = f"Format non supporté : {ext}"
                 if progress_tracker:
                     progress_tracker.update(p.name, False, msg)
-                return False, msg
+                return False, msg, p.name
             display_name = p.name
 
         start_time = time.time()
@@ -664,7 +917,7 @@ class UniversalFileConverter:
             msg = f"Erreur conversion ({display_name}): {e}"
             if progress_tracker:
                 progress_tracker.update(display_name, False, msg)
-            return False, msg
+            return False, msg, display_name
 
         # Déterminer le chemin de sortie
         if is_url:
@@ -679,91 +932,131 @@ class UniversalFileConverter:
 
         try:
             out_p = Path(out)
-            out_p.parent.mkdir(parents=True, exist_ok=True)
-            with open(out_p, 'w', encoding='utf-8') as f:
+            if made_dirs is None or os.path.dirname(out) not in made_dirs:
+                out_p.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                f = open(out_p, 'w', encoding='utf-8')
+            except FileNotFoundError:
+                # dossier annoncé par le cache mais supprimé depuis : on le recrée
+                out_p.parent.mkdir(parents=True, exist_ok=True)
+                f = open(out_p, 'w', encoding='utf-8')
+            with f:
                 f.write(md)
             
-            # Statistiques du fichier
-            conversion_time = time.time() - start_time
-            if not is_url:
-                input_size = p.stat().st_size
-            else:
-                input_size = 0  # Taille inconnue pour les URLs
-            output_size = out_p.stat().st_size
-            
             msg = f"Converti: {display_name} -> {out_p.name}"
-            if self.verbose and not is_url:
-                msg += f" ({human_readable_size(input_size)} -> {human_readable_size(output_size)}, {conversion_time:.2f}s)"
-            elif self.verbose:
-                msg += f" (Taille sortie: {human_readable_size(output_size)}, {conversion_time:.2f}s)"
+            # Statistiques du fichier (stat uniquement en mode verbeux)
+            if self.verbose:
+                conversion_time = time.time() - start_time
+                output_size = out_p.stat().st_size
+                if not is_url:
+                    input_size = p.stat().st_size
+                    msg += f" ({human_readable_size(input_size)} -> {human_readable_size(output_size)}, {conversion_time:.2f}s)"
+                else:
+                    msg += f" (Taille sortie: {human_readable_size(output_size)}, {conversion_time:.2f}s)"
             
             if progress_tracker:
                 progress_tracker.update(display_name, True, msg)
-            return True, msg
+            return True, msg, display_name
             
         except Exception as e:
             msg = f"Erreur écriture fichier: {e}"
             if progress_tracker:
                 progress_tracker.update(display_name, False, msg)
-            return False, msg
+            return False, msg, display_name
 
     # -----------------------
     # Handlers
     # -----------------------
+    # Rendu Markdown des éléments de contenu d'une page web : balise -> méthode
+    _WEB_RENDERERS = types.MappingProxyType({
+        'h1': '_render_heading', 'h2': '_render_heading', 'h3': '_render_heading',
+        'h4': '_render_heading', 'h5': '_render_heading', 'h6': '_render_heading',
+        'p': '_render_paragraph',
+        'ul': '_render_list', 'ol': '_render_list',
+        'table': '_render_table',
+        'blockquote': '_render_blockquote',
+        'pre': '_render_pre',
+    })
+
+    @staticmethod
+    def _render_heading(element) -> str:
+        level = int(element.name[1])
+        return f"{'#' * level} {element.get_text().strip()}"
+
+    @staticmethod
+    def _render_paragraph(element) -> str:
+        return element.get_text().strip()
+
+    @staticmethod
+    def _render_list(element) -> str:
+        prefix = '- ' if element.name == 'ul' else '1. '
+        return "\n".join(f"{prefix}{li.get_text().strip()}" for li in element.find_all('li', recursive=False))
+
+    @staticmethod
+    def _render_table(element) -> str:
+        rows = [[cell.get_text().strip() for cell in row.find_all(['td', 'th'])] for row in element.find_all('tr')]
+        if not rows:
+            return ""
+        # séparateur construit une fois, d'après le nombre de cellules de la première ligne
+        sep = "| " + " | ".join(["---"] * len(rows[0])) + " |"
+        return "\n".join([f"| {' | '.join(rows[0])} |", sep, *[f"| {' | '.join(cells)} |" for cells in rows[1:]]])
+
+    @staticmethod
+    def _render_blockquote(element) -> str:
+        return f"> {element.get_text().strip()}"
+
+    @staticmethod
+    def _render_pre(element) -> str:
+        return f"```\n{element.get_text().strip()}\n```"
+
     def convert_webpage(self, url: str, depth: int = 0) -> Tuple[str, BeautifulSoup]:
         """Convertit une page web en Markdown et retourne le contenu + soup"""
         try:
-            # Télécharger le contenu de la page
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
+            # Télécharger le contenu de la page (session partagée, User-Agent déjà configuré)
+            with self.session.get(url, timeout=_REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                
+                # Ignorer tôt les ressources non HTML (binaires, médias...)
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type.lower():
+                    return f"# {url}\n\n⚠️ Contenu non HTML ignoré ({content_type})\n", BeautifulSoup("", HTML_PARSER)
+                
+                # Lecture par blocs, plafonnée à MAX_PAGE_BYTES
+                raw = bytearray()
+                for chunk in response.iter_content(65536):
+                    raw.extend(chunk)
+                    if len(raw) >= MAX_PAGE_BYTES:
+                        del raw[MAX_PAGE_BYTES:]
+                        break
             
-            # Parser le contenu HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parser le contenu HTML à partir des octets bruts (pas de décodage intermédiaire).
+            # Le charset n'est imposé que s'il est déclaré par le serveur : sinon requests
+            # supposerait ISO-8859-1 et masquerait la balise <meta charset> de la page.
+            declared_encoding = response.encoding if 'charset=' in content_type.lower() else None
+            soup = BeautifulSoup(bytes(raw), HTML_PARSER, from_encoding=declared_encoding)
             title = soup.title.string if soup.title else urlparse(url).netloc
+            # Seul le corps de la page est parcouru (le <head> ne contient pas de contenu)
+            body = soup.body or soup
             
-            # Nettoyer le contenu
-            for element in soup(['script', 'style', 'header', 'footer', 'nav', 
-                               'aside', 'form', 'iframe', 'button', 'noscript']):
-                element.decompose()
+            # Parcours unique du DOM (ordre du document) : les sous-arbres parasites sont
+            # supprimés dès qu'ils sont rencontrés, les éléments de contenu sont collectés
+            # puis rendus une fois le nettoyage terminé
+            blocks = []
+            stack = [body]
+            while stack:
+                node = stack.pop()
+                if node.name in _SKIPPED_TAGS:
+                    node.decompose()
+                    continue
+                if node.name in _CONTENT_TAGS:
+                    blocks.append(node)
+                stack.extend(reversed([child for child in node.contents if child.name is not None]))
             
             # Structure du contenu
             content = []
-            for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
-                                        'ul', 'ol', 'table', 'blockquote', 'pre']):
-                # Traitement des titres
-                if element.name.startswith('h'):
-                    level = int(element.name[1])
-                    content.append(f"{'#' * level} {element.get_text().strip()}")
-                
-                # Traitement des paragraphes
-                elif element.name == 'p':
-                    content.append(element.get_text().strip())
-                
-                # Traitement des listes
-                elif element.name in ['ul', 'ol']:
-                    list_items = []
-                    for li in element.find_all('li', recursive=False):
-                        prefix = '- ' if element.name == 'ul' else '1. '
-                        list_items.append(f"{prefix}{li.get_text().strip()}")
-                    content.append("\n".join(list_items))
-                
-                # Traitement des tableaux
-                elif element.name == 'table':
-                    rows = element.find_all('tr')
-                    table_md = []
-                    for i, row in enumerate(rows):
-                        cells = [cell.get_text().strip() for cell in row.find_all(['td', 'th'])]
-                        table_md.append("| " + " | ".join(cells) + " |")
-                        if i == 0:
-                            table_md.append("| " + " | ".join(["---"] * len(cells)) + " |")
-                    content.append("\n".join(table_md))
-                
-                # Traitement des citations et code
-                elif element.name == 'blockquote':
-                    content.append(f"> {element.get_text().strip()}")
-                elif element.name == 'pre':
-                    content.append(f"```\n{element.get_text().strip()}\n```")
+            for element in blocks:
+                render = getattr(self, self._WEB_RENDERERS[element.name])
+                content.append(render(element))
             
             # Ajout des métadonnées importantes
             metadata = []
@@ -793,7 +1086,7 @@ class UniversalFileConverter:
             return "\n".join(markdown_content), soup
         
         except Exception as e:
-            return f"# Erreur de conversion web\n\n❌ Impossible de convertir {url}: {str(e)}", BeautifulSoup("", 'html.parser')
+            return f"# Erreur de conversion web\n\n❌ Impossible de convertir {url}: {str(e)}", BeautifulSoup("", HTML_PARSER)
 
     # -----------------------
     # Méthodes de conversion - DÉBUT
@@ -825,27 +1118,49 @@ class UniversalFileConverter:
         p = Path(file_path)
         try:
             from docx import Document
+            from docx.oxml.ns import qn
         except Exception:
             return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install python-docx\n"
         try:
             doc = Document(str(p))
-            md = f"# {p.stem}\n\n"
-            for para in doc.paragraphs:
-                text = para.text.strip()
-                if not text:
-                    md += "\n"
-                else:
-                    md += text + "\n\n"
-            # tableaux simples
-            for table in doc.tables:
-                md += "\n"
-                for i, row in enumerate(table.rows):
-                    cells = [c.text.strip() for c in row.cells]
-                    md += "| " + " | ".join(cells) + " |\n"
-                    if i == 0:
-                        md += "|" + "|".join(["---" for _ in cells]) + "|\n"
-                md += "\n"
-            return md
+            out = [f"# {p.stem}\n\n"]
+            w_p, w_tbl, w_tr, w_tc = qn('w:p'), qn('w:tbl'), qn('w:tr'), qn('w:tc')
+            # Les éléments w:p sont des CT_P de python-docx : leur propriété .text est celle de
+            # Paragraph.text (runs directs et hyperliens uniquement, sauts de page ignorés)
+            # Un seul parcours du corps : paragraphes et tableaux dans l'ordre du document
+            for child in doc.element.body.iterchildren():
+                if child.tag == w_p:
+                    text = child.text.strip()
+                    if not text:
+                        out.append("\n")
+                    else:
+                        out.append(text + "\n\n")
+                elif child.tag == w_tbl:
+                    # tableaux simples
+                    out.append("\n")
+                    above = {}  # colonne de la grille -> texte de la ligne précédente
+                    for i, row in enumerate(child.iterchildren(w_tr)):
+                        cells = []
+                        current = {}
+                        col = getattr(row, 'grid_before', 0)
+                        for cell in row.iterchildren(w_tc):
+                            # une cellule fusionnée est répétée sur chaque colonne couverte ;
+                            # une fusion verticale (vMerge="continue") reprend le texte de la cellule du dessus
+                            if getattr(cell, 'vMerge', None) == "continue":
+                                cell_text = above.get(col, "")
+                            else:
+                                cell_text = "\n".join(cp.text for cp in cell.iterchildren(w_p)).strip()
+                            span = getattr(cell, 'grid_span', 1)
+                            for c in range(col, col + span):
+                                current[c] = cell_text
+                            cells.extend([cell_text] * span)
+                            col += span
+                        above = current
+                        out.append("| " + " | ".join(cells) + " |\n")
+                        if i == 0:
+                            out.append("|" + "|".join(["---" for _ in cells]) + "|\n")
+                    out.append("\n")
+            return "".join(out)
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture DOCX: {e}\n"
 
@@ -855,9 +1170,8 @@ class UniversalFileConverter:
         try:
             with open(p, 'rb') as f:
                 raw = f.read()
-            text = raw.decode('latin-1', errors='ignore')
-            # strip non-printable
-            text = re.sub(r'[^\x09\x0A\x0D\x20-\x7E\u00A0-\u017F]+', ' ', text)
+            # strip non-printable (au niveau des octets, avant décodage)
+            text = _DOC_STRIP_RE.sub(b' ', raw.translate(_DOC_KEEP)).decode('latin-1')
             return f"# {p.stem}\n\n⚠️ Conversion basique .DOC\n\n{text}"
         except Exception as e:
             return f"# {p.stem}\n\n❌ Impossible de lire .DOC: {e}\n"
@@ -869,25 +1183,43 @@ class UniversalFileConverter:
         except Exception:
             return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install openpyxl\n"
         try:
-            wb = load_workbook(filename=str(p), data_only=True)
-            md = f"# {p.stem}\n\n"
-            for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                md += f"## Feuille: {sheet_name}\n\n"
-                rows = list(sheet.iter_rows(values_only=True))
-                if not rows:
-                    md += "*Feuille vide*\n\n"
-                    continue
-                headers = [str(c) if c is not None else "" for c in rows[0]]
-                md += "| " + " | ".join(headers) + " |\n"
-                md += "|" + "|".join(["---" for _ in headers]) + "|\n"
-                for r in rows[1:101]:
-                    vals = [str(c) if c is not None else "" for c in r]
-                    md += "| " + " | ".join(vals) + " |\n"
-                if len(rows) > 101:
-                    md += f"\n*Seules les 100 premières lignes sont affichées ({len(rows)-1} lignes total)*\n"
-                md += "\n"
-            return md
+            # Lecture en flux : seules les 101 premières lignes de chaque feuille sont conservées
+            wb = load_workbook(filename=str(p), data_only=True, read_only=True)
+            try:
+                out = [f"# {p.stem}\n\n"]
+                for sheet_name in wb.sheetnames:
+                    sheet = wb[sheet_name]
+                    out.append(f"## Feuille: {sheet_name}\n\n")
+                    # La dimension déclarée (<dimension>) est souvent fausse ou absente : largeur et
+                    # nombre de lignes sont calculés sur les cellules réellement lues
+                    if hasattr(sheet, 'reset_dimensions'):
+                        sheet.reset_dimensions()
+                    rows, width, total = [], 0, 0
+                    for r in sheet.iter_rows(values_only=True):
+                        n = len(r)
+                        while n and r[n - 1] is None:
+                            n -= 1
+                        if n > width:
+                            width = n
+                        if total < 101:
+                            rows.append(r)
+                        total += 1
+                    if not rows:
+                        out.append("*Feuille vide*\n\n")
+                        continue
+                    def cells(r):
+                        vals = ['' if c is None else str(c) for c in r[:width]]
+                        return vals + [''] * (width - len(vals))
+                    headers = cells(rows[0])
+                    out.append(f"| {' | '.join(headers)} |\n")
+                    out.append("|" + "|".join(["---" for _ in headers]) + "|\n")
+                    out.extend(f"| {' | '.join(cells(r))} |\n" for r in rows[1:101])
+                    if total > 101:
+                        out.append(f"\n*Seules les 100 premières lignes sont affichées ({total - 1} lignes total)*\n")
+                    out.append("\n")
+                return "".join(out)
+            finally:
+                wb.close()
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture XLSX: {e}\n"
 
@@ -899,21 +1231,20 @@ class UniversalFileConverter:
             return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install xlrd\n"
         try:
             wb = xlrd.open_workbook(str(p))
-            md = f"# {p.stem}\n\n"
+            out = [f"# {p.stem}\n\n"]
             for name in wb.sheet_names():
-                md += f"## Feuille: {name}\n\n"
+                out.append(f"## Feuille: {name}\n\n")
                 sh = wb.sheet_by_name(name)
                 if sh.nrows == 0:
-                    md += "*Feuille vide*\n\n"
+                    out.append("*Feuille vide*\n\n")
                     continue
                 headers = [str(sh.cell_value(0, c)) if sh.ncols > c else f"Col{c+1}" for c in range(sh.ncols)]
-                md += "| " + " | ".join(headers) + " |\n"
-                md += "|" + "|".join(["---" for _ in headers]) + "|\n"
-                for r in range(1, min(sh.nrows, 101)):
-                    row_vals = [str(sh.cell_value(r, c)) for c in range(sh.ncols)]
-                    md += "| " + " | ".join(row_vals) + " |\n"
-                md += "\n"
-            return md
+                out.append(f"| {' | '.join(headers)} |\n")
+                out.append("|" + "|".join(["---" for _ in headers]) + "|\n")
+                out.extend(f"| {' | '.join([str(v) for v in sh.row_values(r)])} |\n"
+                           for r in range(1, min(sh.nrows, 101)))
+                out.append("\n")
+            return "".join(out)
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture XLS: {e}\n"
 
@@ -928,61 +1259,75 @@ class UniversalFileConverter:
             return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install python-pptx\n"
         try:
             prs = Presentation(str(p))
-            md = f"# {p.stem}\n\n*Présentation - {len(prs.slides)} diapositives*\n\n"
+            out = [f"# {p.stem}\n\n*Présentation - {len(prs.slides)} diapositives*\n\n"]
             image_counter = 1
+            saved_images = {}
             
             for i, slide in enumerate(prs.slides, 1):
                 # Titre de la slide
-                title = f"Slide {i}"
-                for shape in slide.shapes:
-                    if shape.has_text_frame and shape.text.strip():
-                        if shape == slide.shapes.title or "title" in shape.name.lower():
+                # (placeholder de titre résolu une fois, puis formes nommées "title" en repli)
+                title_shape = slide.shapes.title
+                title = title_shape.text.strip() if title_shape is not None and title_shape.has_text_frame else ""
+                if not title:
+                    for shape in slide.shapes:
+                        if "title" in shape.name.lower() and shape.has_text_frame and shape.text.strip():
                             title = shape.text.strip()
                             break
+                title = title or f"Slide {i}"
                 
-                md += f"## {title}\n\n"
+                out.append(f"## {title}\n\n")
                 
                 # Contenu des formes
                 for shape in slide.shapes:
                     if shape.has_text_frame:
-                        text = shape.text.strip()
+                        text = shape.text_frame.text.strip()
                         if text and text != title:
-                            md += f"{text}\n\n"
+                            out.append(f"{text}\n\n")
                     
                     # Extraction d'images (option --pptx-images)
-                    if self.pptx_images and shape.shape_type == 13:  # Picture
+                    if self.pptx_images and shape.shape_type == _PPTX_PICTURE:
                         try:
-                            img_path = self._save_pptx_image(shape, output_path, i, image_counter)
+                            img_path = self._save_pptx_image(shape, output_path, i, image_counter, saved_images)
                             if img_path:
-                                md += f"![Image {image_counter}]({img_path})\n\n"
+                                out.append(f"![Image {image_counter}]({img_path})\n\n")
                                 image_counter += 1
                         except Exception as e:
-                            md += f"<!-- Erreur image: {e} -->\n"
+                            out.append(f"<!-- Erreur image: {e} -->\n")
                 
                 # Notes de présentation (option --pptx-notes)
                 if self.pptx_notes:
-                    if slide.has_notes_slide and slide.notes_slide.notes_text_frame.text.strip():
-                        md += "### Notes\n\n"
-                        md += slide.notes_slide.notes_text_frame.text.strip() + "\n\n"
+                    notes = slide.notes_slide.notes_text_frame.text.strip() if slide.has_notes_slide else ""
+                    if notes:
+                        out.append("### Notes\n\n")
+                        out.append(notes + "\n\n")
                 
-                md += "---\n\n"
-            return md
+                out.append("---\n\n")
+            return "".join(out)
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture PPTX: {e}\n"
 
-    def _save_pptx_image(self, shape, output_path, slide_num, img_num):
-        """Sauvegarde les images des PPTX avec chemin relatif"""
+    def _save_pptx_image(self, shape, output_path, slide_num, img_num, saved: Optional[Dict[bytes, str]] = None):
+        """Sauvegarde les images des PPTX avec chemin relatif.
+        `saved` (empreinte sha1 -> chemin) évite de réécrire une image répétée sur plusieurs slides"""
         if not output_path:
             return None
+        
+        blob = shape.image.blob
+        digest = hashlib.sha1(blob).digest() if saved is not None else None
+        if digest is not None and digest in saved:
+            return saved[digest]
             
         output_dir = Path(output_path).parent / "images"
         output_dir.mkdir(exist_ok=True, parents=True)
         img_path = output_dir / f"slide_{slide_num}_{img_num}_{shape.name}.png"
         
-        with open(img_path, "wb") as f:
-            f.write(shape.image.blob)
+        with open(img_path, "wb", buffering=1 << 20) as f:
+            f.write(blob)
         
-        return f"./images/{img_path.name}"
+        rel_path = f"./images/{img_path.name}"
+        if digest is not None:
+            saved[digest] = rel_path
+        return rel_path
 
     def convert_ppt(self, file_path: str, output_path: Optional[str] = None) -> str:
         p = Path(file_path)
@@ -1006,7 +1351,7 @@ class UniversalFileConverter:
         
     def _convert_pdf_standard(self, file_path: str, output_path: Optional[str] = None) -> str:
         p = Path(file_path)
-        md = f"# {p.stem}\n\n"
+        out = [f"# {p.stem}\n\n"]
         # Attempt imports
         try:
             import PyPDF2
@@ -1014,103 +1359,159 @@ class UniversalFileConverter:
             return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install PyPDF2\n"
 
         # Optional OCR libs
-        pdf2image = safe_import('pdf2image')
-        pytesseract = safe_import('pytesseract')
+        pdf2image = self._pdf2image
+        pytesseract = self._pytesseract
         can_ocr = (pdf2image is not None) and (pytesseract is not None)
 
         try:
             with open(p, 'rb') as fh:
                 reader = PyPDF2.PdfReader(fh)
                 n_pages = len(reader.pages)
-                md += f"*Document PDF - {n_pages} pages*\n\n"
+                out.append(f"*Document PDF - {n_pages} pages*\n\n")
                 any_text = False
                 
                 # Créer un dossier pour les images si nécessaire
+                # (liens relatifs au fichier de sortie : calculés une fois pour toutes)
                 images_dir = None
+                rel_prefix = f"{p.stem}_images"
                 if output_path:
                     output_dir = Path(output_path).parent
-                    images_dir = output_dir / f"{p.stem}_images"
+                    images_dir = output_dir / rel_prefix
                     images_dir.mkdir(parents=True, exist_ok=True)
                 
-                for i, page in enumerate(reader.pages, 1):
+                # Première passe : extraction directe du texte
+                texts = []
+                for page in reader.pages:
                     try:
-                        text = page.extract_text() or ""
+                        texts.append(page.extract_text() or "")
                     except Exception:
-                        text = ""
+                        texts.append("")
+                
+                # Pages sans texte regroupées en plages contiguës : un seul appel pdftoppm
+                # par plage au lieu d'un par page (plages bornées pour limiter la mémoire)
+                blank_pages = [i for i, text in enumerate(texts, 1) if not text.strip()]
+                render_runs = dict(self._page_runs(blank_pages, _PDF_RENDER_BATCH))
+                page_images = {}
+                render_errors = {}
+                ocr_results = {}
+                
+                for i, text in enumerate(texts, 1):
                     if text and text.strip():
                         any_text = True
-                        md += f"## Page {i}\n\n"
+                        out.append(f"## Page {i}\n\n")
                         # Basic cleanup
                         for line in text.splitlines():
                             if line.strip():
-                                md += line.rstrip() + "\n\n"
-                        md += "---\n\n"
+                                out.append(line.rstrip() + "\n\n")
+                        out.append("---\n\n")
                     else:
+                        # Rendu de la plage commençant à cette page
+                        if can_ocr and i in render_runs:
+                            last = render_runs[i]
+                            try:
+                                images = pdf2image.convert_from_path(str(p), first_page=i, last_page=last,
+                                                                     thread_count=min(self.threads, last - i + 1))
+                                page_images.update(zip(range(i, last + 1), images))
+                            except Exception as e:
+                                render_errors.update((k, e) for k in range(i, last + 1))
+                            else:
+                                # OCR (et sauvegarde des images) de toute la plage en parallèle, dans l'ordre des pages
+                                run_pages = range(i, i + len(images))
+                                image_paths = [images_dir / f"page_{k:03d}.png" if images_dir else None for k in run_pages]
+                                ocr_results.update(zip(run_pages, self._get_ocr_pool().map(
+                                    lambda args: self._ocr_pdf_page(pytesseract, *args), zip(images, image_paths))))
+                        # Image de la page : rendue et sauvegardée au plus une fois
+                        img = page_images.pop(i, None)
+                        render_error = render_errors.pop(i, None)
+                        image_path = None
+                        rel_path = f"{rel_prefix}/page_{i:03d}.png"
                         # Fallback OCR for this page if possible
                         if can_ocr:
                             try:
-                                images = pdf2image.convert_from_path(str(p), first_page=i, last_page=i)
-                                if images:
-                                    img = images[0]
-                                    ocr_text = pytesseract.image_to_string(img, lang=self.ocr_language)
-                                    
-                                    # Sauvegarder l'image originale
-                                    image_path = None
-                                    if images_dir:
-                                        image_path = images_dir / f"page_{i:03d}.png"
-                                        img.save(image_path, "PNG")
+                                if render_error is not None:
+                                    raise render_error
+                                if img is not None:
+                                    ocr_text, ocr_error, image_path = ocr_results.pop(i)
+                                    if ocr_error is not None:
+                                        raise ocr_error
                                     
                                     if ocr_text and ocr_text.strip():
                                         any_text = True
-                                        md += f"## Page {i} (OCR)\n\n"
+                                        out.append(f"## Page {i} (OCR)\n\n")
                                         if image_path:
-                                            rel_path = os.path.relpath(image_path, Path(output_path).parent)
-                                            md += f"![Page {i}]({rel_path})\n\n"
-                                        md += f"{ocr_text}\n\n---\n\n"
+                                            out.append(f"![Page {i}]({rel_path})\n\n")
+                                        out.append(f"{ocr_text}\n\n---\n\n")
                                         continue
                                     else:
                                         # OCR a échoué mais on sauvegarde quand même l'image
                                         if image_path:
-                                            rel_path = os.path.relpath(image_path, Path(output_path).parent)
-                                            md += f"## Page {i}\n\n"
-                                            md += f"![Page {i}]({rel_path})\n\n"
-                                            md += f"*— Texte non détecté par OCR —*\n\n---\n\n"
+                                            out.append(f"## Page {i}\n\n")
+                                            out.append(f"![Page {i}]({rel_path})\n\n")
+                                            out.append(f"*— Texte non détecté par OCR —*\n\n---\n\n")
                                         else:
-                                            md += f"## Page {i}\n\n*— Aucun texte détecté (page peut être une image) —*\n\n---\n\n"
+                                            out.append(f"## Page {i}\n\n*— Aucun texte détecté (page peut être une image) —*\n\n---\n\n")
                             except Exception as e:
                                 # OCR failed for this page; continue
-                                md += f"<!-- OCR erreur page {i}: {e} -->\n"
-                                md += f"## Page {i}\n\n*— Erreur OCR —*\n\n---\n\n"
+                                out.append(f"<!-- OCR erreur page {i}: {e} -->\n")
+                                out.append(f"## Page {i}\n\n*— Erreur OCR —*\n\n---\n\n")
                         # Si pas d'OCR ou OCR non disponible, on crée un lien vers l'image si possible
                         if can_ocr and images_dir:
                             try:
-                                images = pdf2image.convert_from_path(str(p), first_page=i, last_page=i)
-                                if images:
-                                    img = images[0]
-                                    image_path = images_dir / f"page_{i:03d}.png"
-                                    img.save(image_path, "PNG")
-                                    rel_path = os.path.relpath(image_path, Path(output_path).parent)
-                                    md += f"## Page {i}\n\n"
-                                    md += f"![Page {i}]({rel_path})\n\n"
-                                    md += f"*— Aucun texte détecté —*\n\n---\n\n"
+                                if render_error is not None:
+                                    raise render_error
+                                if img is not None:
+                                    if image_path is None:
+                                        image_path = images_dir / f"page_{i:03d}.png"
+                                        img.save(image_path, "PNG")
+                                    out.append(f"## Page {i}\n\n")
+                                    out.append(f"![Page {i}]({rel_path})\n\n")
+                                    out.append(f"*— Aucun texte détecté —*\n\n---\n\n")
                                 else:
-                                    md += f"## Page {i}\n\n*— Aucun texte détecté (erreur extraction image) —*\n\n---\n\n"
+                                    out.append(f"## Page {i}\n\n*— Aucun texte détecté (erreur extraction image) —*\n\n---\n\n")
                             except Exception:
-                                md += f"## Page {i}\n\n*— Aucun texte détecté (erreur extraction image) —*\n\n---\n\n"
+                                out.append(f"## Page {i}\n\n*— Aucun texte détecté (erreur extraction image) —*\n\n---\n\n")
                         else:
                             # Not even image extraction available
-                            md += f"## Page {i}\n\n*— Aucun texte détecté (page peut être une image / encodage non standard) —*\n\n---\n\n"
+                            out.append(f"## Page {i}\n\n*— Aucun texte détecté (page peut être une image / encodage non standard) —*\n\n---\n\n")
                 if not any_text:
-                    md += "\n⚠️ Aucun texte détecté dans le PDF (ni extraction directe, ni OCR).\n"
-                return md
+                    out.append("\n⚠️ Aucun texte détecté dans le PDF (ni extraction directe, ni OCR).\n")
+                return "".join(out)
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture PDF: {e}\n"
 
+    def _get_ocr_pool(self) -> ThreadPoolExecutor:
+        """Pool OCR unique de l'instance, borné par min(threads, CPU) et non par fichier"""
+        with self._ocr_pool_lock:
+            if self._ocr_pool is None:
+                self._ocr_pool = ThreadPoolExecutor(max_workers=max(1, min(self.threads, _effective_cpu_count())))
+            return self._ocr_pool
+
+    def _ocr_pdf_page(self, pytesseract, img, image_path: Optional[Path]):
+        """OCR d'une page rendue puis sauvegarde de l'image originale.
+        Retourne (texte, erreur, chemin de l'image sauvegardée)"""
+        try:
+            ocr_text = pytesseract.image_to_string(img, lang=self.ocr_language)
+            if image_path is not None:
+                img.save(image_path, "PNG")
+            return ocr_text, None, image_path
+        except Exception as e:
+            return None, e, None
+
+    @staticmethod
+    def _page_runs(pages: List[int], max_len: int):
+        """Regroupe des numéros de page croissants en plages contiguës (début, fin) de max_len pages au plus"""
+        runs = []
+        for page in pages:
+            if runs and page == runs[-1][1] + 1 and page - runs[-1][0] < max_len:
+                runs[-1][1] = page
+            else:
+                runs.append([page, page])
+        return [(first, last) for first, last in runs]
+
     def _convert_pdf_semantic(self, file_path: str, output_path: Optional[str] = None) -> str:
         """Mode d'extraction sémantique inspiré de mcp-pdf-reader"""
         try:
-            from pdfminer.high_level import extract_pages
-            from pdfminer.layout import LTTextBoxHorizontal, LTFigure, LTImage
+            from pdfminer.layout import LTTextBoxHorizontal, LTChar
             import pdfplumber
         except ImportError:
             return f"# {Path(file_path).stem}\n\n⚠️ Dépendances manquantes pour le mode sémantique: pip install pdfminer.six pdfplumber"
@@ -1124,44 +1525,28 @@ class UniversalFileConverter:
             images_dir = output_dir / f"{p.stem}_images"
             images_dir.mkdir(parents=True, exist_ok=True)
         
-        # Première passe: extraction du texte structuré
-        for page_num, page_layout in enumerate(extract_pages(file_path), 1):
-            md.append(f"## Page {page_num}\n\n")
-            
-            # Détection des éléments
-            elements = []
-            for element in page_layout:
-                if isinstance(element, LTTextBoxHorizontal):
-                    elements.append({
-                        'type': 'text',
-                        'text': element.get_text().strip(),
-                        'x0': element.x0,
-                        'y0': element.y0,
-                        'size': element.size
-                    })
-                elif isinstance(element, LTFigure):
-                    elements.append({
-                        'type': 'figure',
-                        'x0': element.x0,
-                        'y0': element.y0
-                    })
-            
-            # Tri par position (haut vers bas)
-            elements.sort(key=lambda e: -e['y0'])
-            
-            # Traitement des éléments
-            for elem in elements:
-                if elem['type'] == 'text' and elem['text']:
-                    # Détection titre par taille de police
-                    if elem['size'] > 14:
-                        md.append(f"### {elem['text']}\n\n")
+        # Un seul passage : pdfplumber expose la mise en page pdfminer (laparams) et les tableaux de chaque page
+        with pdfplumber.open(file_path, laparams={}) as pdf:
+            for page_num, page in enumerate(pdf.pages, 1):
+                md.append(f"## Page {page_num}\n\n")
+                
+                # Blocs de texte du haut vers le bas (tri stable sur y0, sans objets intermédiaires)
+                boxes = [e for e in page.layout if isinstance(e, LTTextBoxHorizontal)]
+                boxes.sort(key=attrgetter('y0'), reverse=True)
+                
+                for box in boxes:
+                    text = box.get_text().strip()
+                    if not text:
+                        continue
+                    # Détection titre par taille de police (plus grand caractère du bloc)
+                    size = max((ch.size for line in box for ch in line if isinstance(ch, LTChar)), default=0)
+                    if size > 14:
+                        md.append(f"### {text}\n\n")
                     else:
-                        md.append(f"{elem['text']}\n\n")
-            
-            # Extraction des tableaux avec pdfplumber
-            try:
-                with pdfplumber.open(file_path) as pdf:
-                    page = pdf.pages[page_num-1]
+                        md.append(f"{text}\n\n")
+                
+                # Extraction des tableaux avec pdfplumber (même page, déjà analysée)
+                try:
                     tables = page.extract_tables()
                     
                     if tables:
@@ -1175,10 +1560,12 @@ class UniversalFileConverter:
                             for row in table[1:]:
                                 md.append("| " + " | ".join(str(cell) for cell in row) + " |\n")
                             md.append("\n")
-            except Exception as e:
-                md.append(f"<!-- Erreur extraction tableau: {e} -->\n")
-            
-            md.append("---\n\n")
+                except Exception as e:
+                    md.append(f"<!-- Erreur extraction tableau: {e} -->\n")
+                
+                md.append("---\n\n")
+                # libère le cache de la page (objets pdfminer) avant la suivante
+                page.close()
         
         return "".join(md)
 
@@ -1191,7 +1578,7 @@ class UniversalFileConverter:
             from PIL import Image
         except Exception:
             return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install Pillow\n"
-        pytesseract = safe_import('pytesseract')
+        pytesseract = self._pytesseract
         can_ocr = pytesseract is not None
         try:
             img = Image.open(p)
@@ -1222,45 +1609,50 @@ class UniversalFileConverter:
             with open(p, 'r', encoding='utf-8', errors='ignore') as f:
                 sample = f.read(2048)
                 f.seek(0)
-                sniffer = csv.Sniffer()
-                dialect = sniffer.sniff(sample) if sample else csv.excel
-                f.seek(0)
-                reader = csv.reader(f, dialect)
-                rows = list(reader)
+                # Le sniffer n'est utile que si plusieurs séparateurs sont candidats
+                delimiters = [d for d in _CSV_DELIMITERS if d in sample]
+                if len(delimiters) > 1:
+                    reader = csv.reader(f, csv.Sniffer().sniff(sample))
+                else:
+                    reader = csv.reader(f, csv.excel, delimiter=delimiters[0] if delimiters else ',')
+                # Lecture en flux : seules les lignes affichées sont conservées, le reste est compté
+                rows = list(islice(reader, 202))
+                total = len(rows) - 1 + (sum(1 for _ in reader) if len(rows) > 201 else 0)
         except Exception:
             # fallback simple split
             try:
                 with open(p, 'r', encoding='utf-8', errors='ignore') as f:
-                    rows = [line.strip().split(',') for line in f.readlines()]
+                    rows = [line.strip().split(',') for line in islice(f, 202)]
+                    total = len(rows) - 1 + (sum(1 for _ in f) if len(rows) > 201 else 0)
             except Exception as e:
                 return f"# {p.stem}\n\n❌ Erreur lecture CSV: {e}\n"
         if not rows:
             return f"# {p.stem}\n\n*Fichier CSV vide*\n"
         headers = [str(h) for h in rows[0]]
-        md = f"# {p.stem}\n\n| " + " | ".join(headers) + " |\n"
-        md += "|" + "|".join(["---" for _ in headers]) + "|\n"
-        for row in rows[1:201]:
-            row = row + [""] * (len(headers) - len(row))
-            md += "| " + " | ".join(str(c) for c in row[:len(headers)]) + " |\n"
+        out = [f"# {p.stem}\n\n| {' | '.join(headers)} |\n"]
+        out.append("|" + "|".join(["---" for _ in headers]) + "|\n")
+        width, fill = len(headers), [""] * len(headers)
+        out.extend(f"| {' | '.join((row + fill)[:width])} |\n" for row in rows[1:201])
         if len(rows) > 201:
-            md += f"\n*Seules les 200 premières lignes affichées ({len(rows)-1} lignes total)*\n"
-        return md
+            out.append(f"\n*Seules les 200 premières lignes affichées ({total} lignes total)*\n")
+        return "".join(out)
 
     def convert_tsv(self, file_path: str, output_path: Optional[str] = None) -> str:
         # Simplifié: utilise csv.reader avec tab delimiter
         p = Path(file_path)
         try:
             with open(p, 'r', encoding='utf-8', errors='ignore') as f:
-                rows = list(csv.reader(f, delimiter='\t'))
+                reader = csv.reader(f, delimiter='\t')
+                # Lecture en flux : seules l'en-tête et les 200 lignes affichées sont lues
+                rows = list(islice(reader, 201))
             if not rows:
                 return f"# {p.stem}\n\n*Fichier TSV vide*\n"
             headers = [str(h) for h in rows[0]]
-            md = f"# {p.stem}\n\n| " + " | ".join(headers) + " |\n"
-            md += "|" + "|".join(["---" for _ in headers]) + "|\n"
-            for row in rows[1:201]:
-                row = row + [""] * (len(headers) - len(row))
-                md += "| " + " | ".join(str(c) for c in row[:len(headers)]) + " |\n"
-            return md
+            out = [f"# {p.stem}\n\n| {' | '.join(headers)} |\n"]
+            out.append("|" + "|".join(["---" for _ in headers]) + "|\n")
+            width, fill = len(headers), [""] * len(headers)
+            out.extend(f"| {' | '.join((row + fill)[:width])} |\n" for row in rows[1:])
+            return "".join(out)
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture TSV: {e}\n"
 
@@ -1268,12 +1660,36 @@ class UniversalFileConverter:
         p = Path(file_path)
         try:
             with open(p, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            pretty = json.dumps(data, indent=2, ensure_ascii=False)
+                raw = f.read().strip()
+            if "\n" in raw:
+                # Déjà formaté sur plusieurs lignes : intégré tel quel, sans aller-retour dumps,
+                # mais validé pour qu'un JSON invalide reste signalé en erreur
+                self._check_json(raw)
+                pretty = raw
+            else:
+                pretty = None
+                if _ORJSON is not None and not _JSON_BIG_INT_RE.search(raw):
+                    try:
+                        pretty = _ORJSON.dumps(_ORJSON.loads(raw), option=_ORJSON.OPT_INDENT_2).decode('utf-8')
+                    except Exception:
+                        pretty = None  # JSON refusé par orjson (NaN, etc.) : repli sur json
+                if pretty is None:
+                    pretty = json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
             return f"# {p.stem}\n\n```json\n{pretty}\n```"
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur JSON: {e}\n"
 
+    @staticmethod
+    def _check_json(raw: str):
+        """Lève une exception si raw n'est pas un JSON valide (orjson si disponible, json sinon)"""
+        if _ORJSON is not None:
+            try:
+                _ORJSON.loads(raw)
+                return
+            except Exception:
+                pass  # NaN, Infinity... acceptés par json : c'est lui qui tranche
+        json.loads(raw)
+
     def convert_yaml(self, file_path: str, output_path: Optional[str] = None) -> str:
         p = Path(file_path)
         try:
@@ -1293,27 +1709,48 @@ class UniversalFileConverter:
     def convert_html(self, file_path: str, output_path: Optional[str] = None) -> str:
         p = Path(file_path)
         try:
-            from bs4 import BeautifulSoup
+            from lxml import html as lxml_html
         except Exception:
-            return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install beautifulsoup4\n"
+            lxml_html = None
+        if lxml_html is None:
+            try:
+                from bs4 import BeautifulSoup
+            except Exception:
+                return f"# {p.stem}\n\n⚠️ Dépendance manquante: pip install lxml (ou beautifulsoup4)\n"
         try:
             with open(p, 'r', encoding='utf-8', errors='ignore') as f:
                 html = f.read()
-            soup = BeautifulSoup(html, 'html.parser')
-            for s in soup(["script", "style"]):
-                s.decompose()
-            text = soup.get_text(separator="\n")
+            if not html.strip():
+                text = ""
+            elif lxml_html is not None:
+                text = self._lxml_text(html.encode('utf-8'))
+            else:
+                soup = BeautifulSoup(html, 'html.parser')
+                for s in soup(["script", "style"]):
+                    s.decompose()
+                text = soup.get_text(separator="\n")
             md = f"# {p.stem}\n\n{text.strip()}\n"
             return md
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur lecture HTML: {e}\n"
 
+    @staticmethod
+    def _lxml_text(data: bytes) -> str:
+        """Texte d'un document HTML UTF-8 sans scripts ni styles, parsé et nettoyé en C (libxml2).
+        Même texte que BeautifulSoup get_text(separator="\n")"""
+        from lxml import etree, html as lxml_html
+        # Un parser par appel : les parsers lxml ne se partagent pas entre threads.
+        parser = lxml_html.HTMLParser(encoding='utf-8')
+        root = lxml_html.document_fromstring(data, parser=parser)
+        etree.strip_elements(root, 'script', 'style', with_tail=False)
+        return "\n".join(root.itertext())
+
     def convert_xml(self, file_path: str, output_path: Optional[str] = None) -> str:
         p = Path(file_path)
         try:
-            tree = ET.parse(p)
-            root = tree.getroot()
-            xml_str = ET.tostring(root, encoding='unicode')
+            # Contenu brut : pas de parse + re-sérialisation de tout l'arbre pour un simple bloc de code
+            with open(p, 'r', encoding='utf-8', errors='ignore') as f:
+                xml_str = f.read().strip()
             return f"# {p.stem}\n\n```xml\n{xml_str}\n```"
         except Exception as e:
             return f"# {p.stem}\n\n❌ Erreur XML: {e}\n"
@@ -1326,13 +1763,25 @@ class UniversalFileConverter:
             from bs4 import BeautifulSoup
         except Exception:
             return f"# {p.stem}\n\n⚠️ Dépendances manquantes: pip install ebooklib beautifulsoup4\n"
+        has_lxml = safe_import('lxml') is not None
         try:
             book = epub.read_epub(str(p))
             md = f"# {p.stem}\n\n"
             for item in book.get_items():
                 if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                    soup = BeautifulSoup(item.get_content(), 'html.parser')
-                    text = soup.get_text(separator="\n").strip()
+                    content = item.get_content()
+                    text = None
+                    if has_lxml and content.strip():
+                        try:
+                            # les chapitres EPUB sont en UTF-8
+                            text = self._lxml_text(content).strip()
+                        except Exception:
+                            text = None
+                    if text is None:
+                        soup = BeautifulSoup(content, 'html.parser')
+                        for s in soup(["script", "style"]):
+                            s.decompose()
+                        text = soup.get_text(separator="\n").strip()
                     if text:
                         md += text + "\n\n"
             return md
@@ -1386,25 +1835,37 @@ class UniversalFileConverter:
     # -----------------------
     # Directory / batch processing avec progression
     # -----------------------
-    def convert_directory(self, dir_path: str, output_dir: Optional[str] = None, recursive: bool = False):
+    def convert_directory(self, dir_path: str, output_dir: Optional[str] = None, recursive: bool = False,
+                          exclude: Optional[str] = None):
         input_dir = Path(dir_path)
         if not input_dir.is_dir():
             print(f"❌ Répertoire introuvable: {dir_path}")
             return
+        try:
+            exclude_re = re.compile(exclude) if exclude else None
+        except re.error as e:
+            print(f"❌ Motif --exclude invalide: {e}")
+            return
 
         out_dir = Path(output_dir) if output_dir else input_dir / "markdown_output"
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        pattern = "**/*" if recursive else "*"
-        files = [p for p in input_dir.glob(pattern) if p.is_file() and p.suffix.lower() in self.supported_formats]
+        # Un seul passage : chemin de sortie et taille totale calculés pendant le parcours.
+        # Le chemin relatif a toujours une extension (filtrée par le parcours) : simple découpage de chaîne
+        out_base = os.fspath(out_dir)
+        work = []
+        total_size = 0
+        for src, rel, size in self._iter_supported(str(input_dir), recursive, exclude_re):
+            work.append((src, os.path.join(out_base, rel[:rel.rfind('.')] + '.md'), size))
+            total_size += size
+        self._order_work(work)
         
-        if not files:
+        if not work:
             print("Aucun fichier supporté trouvé.")
             return
 
         # Analyse préliminaire
-        total_size = sum(p.stat().st_size for p in files)
-        print(f"🔍 Analyse: {len(files)} fichier(s) trouvé(s)")
+        print(f"🔍 Analyse: {len(work)} fichier(s) trouvé(s)")
         print(f"📦 Taille totale: {human_readable_size(total_size)}")
         print(f"🧵 Threads: {self.threads}")
         print(f"📁 Sortie: {out_dir}")
@@ -1412,41 +1873,210 @@ class UniversalFileConverter:
         print("-" * 60)
 
         # Initialiser le tracker de progression
-        progress_tracker = ProgressTracker(len(files))
-
-        with ThreadPoolExecutor(max_workers=self.threads) as ex:
-            futures = {}
-            for p in files:
-                rel = p.relative_to(input_dir)
-                out = out_dir / rel.with_suffix('.md')
-                out.parent.mkdir(parents=True, exist_ok=True)
-                futures[ex.submit(self.convert_file_with_progress, str(p), str(out), progress_tracker)] = (p, out)
-            
-            # Attendre la completion
-            for fut in as_completed(futures):
-                p, out = futures[fut]
-                try:
-                    ok, msg = fut.result()
-                except Exception as e:
-                    progress_tracker.update(p.name, False, f"Exception: {e}")
+        progress_tracker = ProgressTracker(len(work))
+
+        # Un mkdir par dossier de sortie distinct, les moins profonds d'abord ; les dossiers créés
+        # lors d'une exécution précédente (cache dans le dossier de sortie) ne sont pas recréés
+        made_dirs = {out_base}
+        cache_path = os.path.join(out_base, _DIRCACHE_NAME)
+        known_dirs = self._load_dircache(cache_path)
+        rel_dirs = set()
+        for parent in sorted({os.path.dirname(out) for _, out, _ in work} - made_dirs, key=lambda d: d.count(os.sep)):
+            rel_parent = parent[len(out_base) + 1:]
+            if rel_parent not in known_dirs:
+                os.makedirs(parent, exist_ok=True)
+            made_dirs.add(parent)
+            rel_dirs.add(rel_parent)
+        self._save_dircache(cache_path, known_dirs | rel_dirs)
+
+        self._run_conversions(work, progress_tracker, made_dirs)
 
         progress_tracker.final_summary()
         print(f"📁 Fichiers de sortie disponibles dans: {out_dir}")
 
+    def _order_work(self, work: list):
+        """Ordonne la liste (source, sortie, taille) selon --schedule : 'lpt' place les plus gros
+        fichiers en premier (aucun gros fichier isolé en fin de lot), 'fifo' garde l'ordre de parcours"""
+        if self.schedule == 'lpt':
+            work.sort(key=lambda w: w[2], reverse=True)
+
+    def _run_conversions(self, items: List[Tuple[str, Optional[str], int]], progress_tracker: ProgressTracker,
+                         made_dirs: Optional[set] = None):
+        """Convertit les triplets (source, sortie, taille) avec au plus 2 x threads tâches en attente :
+        mémoire bornée et premiers résultats dès le début, quelle que soit la taille de la liste.
+        Aucune structure par tâche hormis l'ensemble des futures en cours"""
+        max_in_flight = 2 * self.threads
+        in_flight = set()
+        prefetch_window = self._start_prefetch(items, 2 * max_in_flight)
+        with ThreadPoolExecutor(max_workers=self.threads) as ex, \
+                self._open_process_pool(item[0] for item in items) as proc_ex:
+            config = self._process_config() if proc_ex is not None else None
+            for src, out, _ in items:
+                if len(in_flight) >= max_in_flight:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                # Formats CPU-bound vers les processus (option --processes), le reste sur les threads
+                in_process = proc_ex is not None and os.path.splitext(src)[1].lower() in _CPU_BOUND_EXTS
+                if in_process:
+                    fut = proc_ex.submit(_process_convert, src, out, config)
+                else:
+                    fut = ex.submit(self.convert_file_with_progress, src, out, progress_tracker, made_dirs)
+                # La progression est mise à jour à la fin de chaque tâche, sans boucle d'attente
+                fut.add_done_callback(functools.partial(self._report_done, src=src,
+                                                        progress_tracker=progress_tracker,
+                                                        report_result=in_process))
+                in_flight.add(fut)
+                if prefetch_window is not None:
+                    prefetch_window.release()
+            # la sortie des blocs with attend la fin des tâches restantes
+
+    def _start_prefetch(self, items: List[Tuple[str, Optional[str], int]], ahead: int):
+        """Option --prefetch : thread démon qui demande au noyau de lire à l'avance (POSIX_FADV_WILLNEED)
+        les fichiers à venir, au plus `ahead` fichiers devant la soumission. Retourne le sémaphore à
+        libérer à chaque soumission, ou None si l'option est inactive ou non supportée (Windows, macOS)"""
+        if not self.prefetch or not hasattr(os, 'posix_fadvise'):
+            return None
+        window = threading.Semaphore(ahead)
+
+        def prefetch_loop():
+            for src, _, _ in items:
+                window.acquire()
+                try:
+                    fd = os.open(src, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+
+        threading.Thread(target=prefetch_loop, daemon=True).start()
+        return window
+
+    @staticmethod
+    def _report_done(fut, src: str, progress_tracker: ProgressTracker, report_result: bool):
+        """Callback de fin de tâche : résultat des processus (qui n'ont pas accès au tracker)
+        et exceptions non gérées des threads (les succès y sont déjà comptés par le worker).
+        Le nom affiché vient du résultat ; `src` ne sert qu'à nommer une tâche en exception"""
+        exc = fut.exception()
+        if exc is not None:
+            progress_tracker.update(os.path.basename(src), False, f"Exception: {exc}")
+        elif report_result:
+            ok, msg, name = fut.result()
+            progress_tracker.update(name, ok, msg)
+
+    def _open_process_pool(self, paths):
+        """Pool de processus pour les formats gourmands en CPU (option --processes).
+        Contexte vide (None) si l'option est désactivée ou si aucun fichier n'est concerné"""
+        if self.processes and any(os.path.splitext(p)[1].lower() in _CPU_BOUND_EXTS for p in paths):
+            return ProcessPoolExecutor(max_workers=self.threads)
+        return contextlib.nullcontext()
+
+    def _process_config(self) -> Dict[str, Any]:
+        """Options (sérialisables) pour reconstruire un convertisseur dans un processus de travail"""
+        return {
+            'ocr_force': self.ocr_force,
+            'no_compress': self.no_compress,
+            'ocr_language': self.ocr_language,
+            # un fichier par processus : pas de threads supplémentaires à l'intérieur
+            'threads': 1,
+            'verbose': self.verbose,
+            'semantic_mode': self.semantic_mode,
+            'pptx_images': self.pptx_images,
+            'pptx_notes': self.pptx_notes,
+        }
+
+    @staticmethod
+    def _load_dircache(cache_path: str) -> set:
+        """Dossiers (relatifs) créés lors des exécutions précédentes ; ensemble vide si absent ou illisible"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return set(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return set()
+
+    @staticmethod
+    def _save_dircache(cache_path: str, rel_dirs: set):
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(sorted(rel_dirs), f, ensure_ascii=False)
+        except OSError:
+            pass  # cache facultatif
+
+    @staticmethod
+    def _is_pruned(name: str, exclude: Optional[re.Pattern]) -> bool:
+        """Dossier à ne pas explorer : liste fixe, dossier caché ou motif --exclude"""
+        return (name in _PRUNED_DIRS or name.startswith('.')
+                or (exclude is not None and exclude.search(name) is not None))
+
+    def _iter_supported(self, root: str, recursive: bool, exclude: Optional[re.Pattern] = None):
+        """Parcourt un dossier via os.scandir (pile explicite si récursif) et produit, pour chaque
+        fichier supporté, (chemin, chemin relatif à root, taille) sans second stat.
+        Les dossiers élagués (_PRUNED_DIRS, cachés, ou dont le nom correspond à exclude) ne sont
+        pas parcourus ; exclude s'applique aussi aux noms de fichiers"""
+        stack = [(root, "")]
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            # Un dossier illisible (droits, supprimé entre-temps...) est ignoré, pas tout le parcours
+            try:
+                it = os.scandir(dir_path)
+            except OSError as e:
+                if self.verbose:
+                    print(f"⚠️ Dossier ignoré: {dir_path} ({e})")
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        # d_type lu avec le dossier : pas de stat, et pas de suivi des liens vers des dossiers
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if recursive and not self._is_pruned(entry.name, exclude):
+                            stack.append((entry.path, rel_prefix + entry.name + os.sep))
+                        continue
+                    # même règle que Path.suffix : pas d'extension pour ".bashrc" ou "Makefile"
+                    stem, dot, ext = entry.name.rpartition('.')
+                    if not (dot and stem) or ext.lower() not in self._supported_exts:
+                        continue
+                    if exclude is not None and exclude.search(entry.name):
+                        continue
+                    # fichier régulier lu depuis d_type ; seuls les liens symboliques coûtent un stat
+                    try:
+                        if not (entry.is_file(follow_symlinks=False) or (entry.is_symlink() and entry.is_file())):
+                            continue
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    yield entry.path, rel_prefix + entry.name, size
+
     def batch_convert(self, files: List[str], output_dir: Optional[str] = None):
         if not files:
             print("Aucun fichier fourni.")
             return
             
-        # Normalize list, filter unsupported
-        valid = []
+        # Normalize list, filter unsupported : un seul stat par fichier (existence et taille)
+        valid = []  # (chemin, sortie, taille)
         invalid = []
+        total_size = 0
         for f in files:
-            p = Path(f)
-            if p.exists() and p.suffix.lower() in self.supported_formats:
-                valid.append(p)
-            else:
+            stem, dot, ext = os.path.basename(f).rpartition('.')
+            if not (dot and stem) or ext.lower() not in self._supported_exts:
+                invalid.append(f)
+                continue
+            try:
+                st = os.stat(f)
+            except OSError:
                 invalid.append(f)
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                invalid.append(f)
+                continue
+            p = Path(f)
+            out_path = str(Path(output_dir) / f"{p.stem}.md") if output_dir else None
+            valid.append((str(p), out_path, st.st_size))
+            total_size += st.st_size
                 
         if invalid:
             print("⚠️ Fichiers ignorés (inexistant ou format non supporté):")
@@ -1456,9 +2086,9 @@ class UniversalFileConverter:
         if not valid:
             print("❌ Aucun fichier valide à convertir.")
             return
+        self._order_work(valid)
 
         # Analyse préliminaire
-        total_size = sum(p.stat().st_size for p in valid)
         print(f"🔍 Analyse: {len(valid)} fichier(s) valide(s)")
         print(f"📦 Taille totale: {human_readable_size(total_size)}")
         print(f"🧵 Threads: {self.threads}")
@@ -1469,22 +2099,22 @@ class UniversalFileConverter:
         # Initialiser le tracker de progression
         progress_tracker = ProgressTracker(len(valid))
         
-        with ThreadPoolExecutor(max_workers=self.threads) as ex:
-            futures = {}
-            for p in valid:
-                out_path = str(Path(output_dir) / f"{p.stem}.md") if output_dir else None
-                futures[ex.submit(self.convert_file_with_progress, str(p), out_path, progress_tracker)] = p
-                
-            # Attendre la completion
-            for fut in as_completed(futures):
-                p = futures[fut]
-                try:
-                    ok, msg = fut.result()
-                except Exception as e:
-                    progress_tracker.update(p.name, False, f"Exception: {e}")
+        self._run_conversions(valid, progress_tracker)
 
         progress_tracker.final_summary()
 
+# ---------------------------
+# Processus de travail (option --processes)
+# ---------------------------
+_process_converter = None
+
+def _process_convert(src: str, out: Optional[str], config: Dict[str, Any]) -> Tuple[bool, str, str]:
+    """Convertit un fichier dans un processus de travail ; le convertisseur est créé une fois par processus"""
+    global _process_converter
+    if _process_converter is None:
+        _process_converter = UniversalFileConverter(**config)
+    return _process_converter.convert_file_with_progress(src, out)
+
 # ---------------------------
 # CLI
 # ---------------------------
@@ -1494,12 +2124,16 @@ def parse_args():
     parser.add_argument("-o", "--output", help="Fichier ou dossier de sortie (si multiple fichiers -> dossier).")
     parser.add_argument("-d", "--directory", action="store_true", help="Traiter le paramètre input comme répertoire (prendre input[0]).")
     parser.add_argument("-r", "--recursive", action="store_true", help="Recherche récursive dans les répertoires.")
+    parser.add_argument("--exclude", metavar="PATTERN", help="Expression régulière : dossiers et fichiers dont le nom correspond sont ignorés (mode dossier).")
     parser.add_argument("--batch", action="store_true", help="Mode batch pour plusieurs fichiers listés.")
     parser.add_argument("--install-deps", action="store_true", help="Installe les dépendances Python utiles (pip).")
     parser.add_argument("--ocr-only", action="store_true", help="Force l'OCR pour les images (active ocr_force).")
     parser.add_argument("--no-compress", action="store_true", help="Désactive la compression des images.")
     parser.add_argument("--ocr-lang", default="fra+eng", help="Langues pour l'OCR (ex: fra+eng, eng, spa).")
     parser.add_argument("--threads", type=int, default=None, help="Nombre de threads (par défaut CPU-1).")
+    parser.add_argument("--schedule", choices=["lpt", "fifo"], default="lpt", help="Ordre de traitement des lots : lpt = plus gros fichiers d'abord (défaut), fifo = ordre de parcours.")
+    parser.add_argument("--processes", action="store_true", help="Convertit les formats gourmands en CPU (PDF, images, Office...) dans des processus séparés.")
+    parser.add_argument("--prefetch", action="store_true", help="Précharge les fichiers à venir dans le cache disque pendant les conversions (Linux).")
     parser.add_argument("-v", "--verbose", action="store_true", help="Affichage détaillé (tailles fichiers, temps de conversion).")
     parser.add_argument("--no-progress", action="store_true", help="Désactive la barre de progression (mode silencieux).")
     
@@ -1512,6 +2146,7 @@ def parse_args():
     parser.add_argument("--website", action="store_true", help="Exploration complète d'un site web")
     parser.add_argument("--depth", type=int, default=2, help="Profondeur d'exploration pour les sites web")
     parser.add_argument("--max-pages", type=int, default=50, help="Nombre maximum de pages à convertir")
+    parser.add_argument("--zstd", action="store_true", help="Compresse les pages du site exploré en .md.zst (nécessite zstandard).")
     
     return parser.parse_args()
 
@@ -1522,6 +2157,9 @@ def main():
         install_requirements()
         return
 
+    # Horodatage de démarrage calculé une seule fois
+    startup_ts = datetime.now().strftime('%H:%M:%S')
+
     conv = UniversalFileConverter(
         ocr_force=args.ocr_only,
         no_compress=args.no_compress,
@@ -1530,7 +2168,11 @@ def main():
         verbose=args.verbose,
         semantic_mode=args.semantic,
         pptx_images=args.pptx_images,
-        pptx_notes=args.pptx_notes
+        pptx_notes=args.pptx_notes,
+        zstd_output=args.zstd,
+        processes=args.processes,
+        schedule=args.schedule,
+        prefetch=args.prefetch
     )
 
     # Mode site web
@@ -1549,8 +2191,8 @@ def main():
 
     # Afficher les informations de démarrage
     if not args.no_progress:
-        print(f"🚀 Convertisseur Document - {datetime.now().strftime('%H:%M:%S')}")
-        print(f"💻 CPU: {multiprocessing.cpu_count()} cœurs disponibles")
+        print(f"🚀 Convertisseur Document - {startup_ts}")
+        print(f"💻 CPU: {_effective_cpu_count()} cœurs disponibles")
         if args.semantic:
             print("🔍 Mode sémantique activé pour les PDF")
         if args.pptx_images or args.pptx_notes:
@@ -1562,7 +2204,7 @@ def main():
     # Directory mode
     if args.directory:
         input_path = args.input[0]
-        conv.convert_directory(input_path, output_dir=args.output, recursive=args.recursive)
+        conv.convert_directory(input_path, output_dir=args.output, recursive=args.recursive, exclude=args.exclude)
         return
 
     # Batch mode for multiple files
@@ -1593,7 +2235,7 @@ def main():
             
     
     start_time = time.time()
-    ok, msg = conv.convert_file_with_progress(input_path, out)
+    ok, msg, _ = conv.convert_file_with_progress(input_path, out)
     elapsed = time.time() - start_time
     
     if ok: